@@ -2,40 +2,87 @@
 BeatGuessr Backend - Flask API with WebSocket support
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+import eventlet
+
+eventlet.monkey_patch()
+
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 from flask_socketio import SocketIO
-import json
+import hashlib
 import random
 import uuid
 from pathlib import Path
 from datetime import datetime
 
+import fast_json
+
 app = Flask(__name__, static_folder="../frontend", static_url_path="")
 CORS(app)
 
-# Initialize SocketIO with eventlet for better performance
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode="eventlet")
+if fast_json.HAS_ORJSON:
+    app.json = fast_json.OrjsonProvider(app)
+
+# Initialize SocketIO with eventlet for better performance. WebSocket-only
+# transport avoids long-polling round-trips and sticky sessions.
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode="eventlet",
+    transports=["websocket"],
+    json=fast_json,
+)
 
 # Load song data
 DATA_FILE = Path(__file__).parent.parent / "data" / "songs.json"
-songs_data = {"songs": [], "contexts": {}}
+songs_data = {"songs": [], "contexts": {}, "_by_id": {}}
+
+# Pre-serialized catalog payloads (name -> (body, etag))
+json_payloads = {}
+
+LIGHT_SONG_FIELDS = ("id", "title", "artist", "year")
+
+
+def _precompute_payload(name, payload):
+    """Serialize a static payload once and store it with its ETag."""
+    body = fast_json.dumps_bytes(payload)
+    json_payloads[name] = (body, hashlib.sha1(body).hexdigest())
 
 
 def load_songs():
     global songs_data
     if DATA_FILE.exists():
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            songs_data = json.load(f)
+        with open(DATA_FILE, "rb") as f:
+            songs_data = fast_json.loads(f.read())
         print(f"Loaded {len(songs_data.get('songs', []))} songs")
     else:
         print(f"Warning: Song data file not found at {DATA_FILE}")
 
+    # Index songs by ID for O(1) lookups
+    songs_data["_by_id"] = {s["id"]: s for s in songs_data.get("songs", [])}
+
+    # The catalog is static, so serialize the API responses once
+    songs = songs_data.get("songs", [])
+    _precompute_payload("songs_full", {"songs": songs, "total": len(songs)})
+    _precompute_payload(
+        "songs_light",
+        {
+            "songs": [{k: s.get(k) for k in LIGHT_SONG_FIELDS} for s in songs],
+            "total": len(songs),
+        },
+    )
+    _precompute_payload("contexts", {"contexts": songs_data.get("contexts", {})})
+
 
 # Game sessions storage (in-memory for now)
 game_sessions = {}
 
 
+def serialize_game(game):
+    """Convert a game session into a JSON-serializable dict."""
+    return {**game, "used_song_ids": list(game["used_song_ids"])}
+
+
 # === Routes ===
 
 
@@ -51,27 +98,40 @@ def serve_static(path):
     return send_from_directory(app.static_folder, path)
 
 
+def cached_json_response(name):
+    """Serve a pre-serialized payload, honoring If-None-Match."""
+    body, etag = json_payloads[name]
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "public, max-age=300"}
+
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+
+    return Response(body, mimetype="application/json", headers=headers)
+
+
 @app.route("/api/songs", methods=["GET"])
 def get_songs():
-    """Get all songs."""
-    return jsonify(
-        {
-            "songs": songs_data.get("songs", []),
-            "contexts": songs_data.get("contexts", {}),
-            "total": len(songs_data.get("songs", [])),
-        }
-    )
+    """Get all songs. Pass ?fields=light for id/title/artist/year only."""
+    if request.args.get("fields") == "light":
+        return cached_json_response("songs_light")
+    return cached_json_response("songs_full")
+
+
+@app.route("/api/contexts", methods=["GET"])
+def get_contexts():
+    """Get the year contexts."""
+    return cached_json_response("contexts")
 
 
 @app.route("/api/songs/random", methods=["GET"])
 def get_random_song():
     """Get a random song, optionally excluding certain IDs."""
     exclude = request.args.get("exclude", "").split(",")
-    exclude = [e.strip() for e in exclude if e.strip()]
+    exclude = {e.strip() for e in exclude if e.strip()}
 
-    available_songs = [
-        s for s in songs_data.get("songs", []) if s.get("id") not in exclude
-    ]
+    available_songs = songs_data.get("songs", [])
+    if exclude:
+        available_songs = [s for s in available_songs if s["id"] not in exclude]
 
     if not available_songs:
         return jsonify({"error": "Keine Songs mehr verfügbar"}), 404
@@ -92,42 +152,48 @@ def create_game():
     game_id = str(uuid.uuid4())[:8]
 
     # Get all song IDs for the game pool
-    all_song_ids = [s["id"] for s in songs_data.get("songs", [])]
+    all_song_ids = list(songs_data["_by_id"])
     random.shuffle(all_song_ids)
 
     # Create players with starting cards
     players = []
-    used_song_ids = []
+    used_song_ids = set()
 
     for i, name in enumerate(player_names):
         # Give each player a starting card
         starting_song_id = all_song_ids[i] if i < len(all_song_ids) else None
         if starting_song_id:
-            used_song_ids.append(starting_song_id)
+            used_song_ids.add(starting_song_id)
 
         players.append(
             {
                 "id": i,
                 "name": name,
                 "timeline": [starting_song_id] if starting_song_id else [],
+                "timeline_years": (
+                    [songs_data["_by_id"][starting_song_id]["year"]]
+                    if starting_song_id
+                    else []
+                ),
                 "score": 1 if starting_song_id else 0,
             }
         )
 
-    # Create game session
+    # Create game session. The remaining pool is kept as a shuffled deck so
+    # drawing is a pop from the tail.
     game_sessions[game_id] = {
         "id": game_id,
         "players": players,
         "current_player_index": 0,
         "used_song_ids": used_song_ids,
-        "remaining_song_ids": [s for s in all_song_ids if s not in used_song_ids],
+        "remaining_song_ids": all_song_ids[len(used_song_ids) :],
         "current_song_id": None,
         "status": "playing",
         "winner": None,
         "created_at": datetime.now().isoformat(),
     }
 
-    return jsonify(game_sessions[game_id])
+    return jsonify(serialize_game(game_sessions[game_id]))
 
 
 @app.route("/api/game/<game_id>", methods=["GET"])
@@ -136,7 +202,7 @@ def get_game(game_id):
     if game_id not in game_sessions:
         return jsonify({"error": "Spiel nicht gefunden"}), 404
 
-    return jsonify(game_sessions[game_id])
+    return jsonify(serialize_game(game_sessions[game_id]))
 
 
 @app.route("/api/game/<game_id>/draw", methods=["POST"])
@@ -150,15 +216,20 @@ def draw_card(game_id):
     if game["status"] != "playing":
         return jsonify({"error": "Spiel ist beendet"}), 400
 
+    # Put back a previously drawn but unguessed card
+    if game["current_song_id"]:
+        game["remaining_song_ids"].insert(0, game["current_song_id"])
+        game["current_song_id"] = None
+
     if not game["remaining_song_ids"]:
         return jsonify({"error": "Keine Songs mehr verfügbar"}), 400
 
-    # Draw a random song
-    song_id = random.choice(game["remaining_song_ids"])
+    # Draw the next song from the shuffled deck
+    song_id = game["remaining_song_ids"].pop()
     game["current_song_id"] = song_id
 
     # Find the song data
-    song = next((s for s in songs_data["songs"] if s["id"] == song_id), None)
+    song = songs_data["_by_id"].get(song_id)
 
     return jsonify(
         {
@@ -187,7 +258,7 @@ def submit_guess(game_id):
 
     # Get current song data
     song_id = game["current_song_id"]
-    song = next((s for s in songs_data["songs"] if s["id"] == song_id), None)
+    song = songs_data["_by_id"].get(song_id)
 
     if not song:
         return jsonify({"error": "Song nicht gefunden"}), 404
@@ -195,12 +266,8 @@ def submit_guess(game_id):
     # Get current player
     player = game["players"][game["current_player_index"]]
 
-    # Get player's timeline with years
-    timeline = []
-    for sid in player["timeline"]:
-        s = next((x for x in songs_data["songs"] if x["id"] == sid), None)
-        if s:
-            timeline.append(s["year"])
+    # Player's timeline years, kept sorted alongside the timeline
+    timeline = player["timeline_years"]
 
     # Check if guess is correct
     song_year = song["year"]
@@ -217,6 +284,7 @@ def submit_guess(game_id):
     if is_correct:
         # Insert song into timeline at the correct position
         player["timeline"].insert(position, song_id)
+        player["timeline_years"].insert(position, song_year)
         player["score"] = len(player["timeline"])
 
         # Check for winner
@@ -224,9 +292,8 @@ def submit_guess(game_id):
             game["status"] = "finished"
             game["winner"] = player["name"]
 
-    # Remove song from available pool
-    game["remaining_song_ids"].remove(song_id)
-    game["used_song_ids"].append(song_id)
+    # Song was already removed from the pool when drawn
+    game["used_song_ids"].add(song_id)
     game["current_song_id"] = None
 
     # Move to next player
@@ -249,9 +316,7 @@ def submit_guess(game_id):
 @app.route("/api/song/<song_id>", methods=["GET"])
 def get_song(song_id):
     """Get a specific song by ID."""
-    song = next(
-        (s for s in songs_data.get("songs", []) if s.get("id") == song_id), None
-    )
+    song = songs_data["_by_id"].get(song_id)
 
     if not song:
         return jsonify({"error": "Song nicht gefunden"}), 404
@@ -5,6 +5,7 @@ BeatGuessr Buzzer Mode - WebSocket handlers for real-time multiplayer
 import random
 import string
 import time
+from collections import deque
 from flask import request
 from flask_socketio import emit, join_room, leave_room
 
@@ -23,14 +24,33 @@ def generate_room_code():
             return code
 
 
-def get_room_state(room_code, for_host=False):
-    """Get sanitized room state for clients."""
-    room = rooms.get(room_code)
-    if not room:
-        return None
+def invalidate_room_state(room):
+    """Drop the cached state snapshots after a room mutation."""
+    room.pop("_state_cache", None)
+    room.pop("_host_state_cache", None)
+
+
+def invalidate_leaderboard(room):
+    """Drop the cached score ordering after a score or roster change."""
+    room.pop("_sorted_players", None)
 
+
+def _sorted_player_sids(room):
+    """Get player sids sorted by score descending, cached on the room."""
+    order = room.get("_sorted_players")
+    if order is None:
+        players = room["players"]
+        order = room["_sorted_players"] = tuple(
+            sorted(players, key=lambda sid: players[sid]["score"], reverse=True)
+        )
+    return order
+
+
+def _build_room_state(room_code, room):
+    """Build the sanitized room state shared by players and host."""
     players_list = []
-    for sid, player in room["players"].items():
+    for sid in _sorted_player_sids(room):
+        player = room["players"][sid]
         players_list.append(
             {
                 "id": sid,
@@ -41,9 +61,6 @@ def get_room_state(room_code, for_host=False):
             }
         )
 
-    # Sort by score descending
-    players_list.sort(key=lambda p: p["score"], reverse=True)
-
     state = {
         "roomCode": room_code,
         "maxScore": room["max_score"],
@@ -70,16 +87,64 @@ def get_room_state(room_code, for_host=False):
         if player:
             state["buzzQueue"].append({"id": sid, "name": player["name"]})
 
+    return state
+
+
+def get_room_state(room_code, for_host=False):
+    """Get sanitized room state for clients.
+
+    Both the player and host views are cached on the room until the next
+    invalidate_room_state() call, so repeated emits don't rebuild them.
+    """
+    room = rooms.get(room_code)
+    if not room:
+        return None
+
+    state = room.get("_state_cache")
+    if state is None:
+        state = room["_state_cache"] = _build_room_state(room_code, room)
+
     # Add current song for host only
     if for_host and room["current_song"]:
-        state["currentSong"] = room["current_song"]
+        host_state = room.get("_host_state_cache")
+        if host_state is None:
+            host_state = room["_host_state_cache"] = {
+                **state,
+                "currentSong": room["current_song"],
+            }
+        return host_state
 
     return state
 
 
+def emit_room_state(room_code):
+    """Broadcast the room state to players and host.
+
+    The host is also a member of the player room, so it is skipped there and
+    only receives the host view.
+    """
+    emit(
+        "room_state",
+        get_room_state(room_code),
+        room=room_code,
+        skip_sid=rooms[room_code]["host_sid"],
+    )
+    emit(
+        "room_state",
+        get_room_state(room_code, for_host=True),
+        room=f"{room_code}_host",
+    )
+
+
 def register_buzzer_events(socketio, songs_data):
     """Register all buzzer-related WebSocket events."""
 
+    def new_deck():
+        """Get a freshly shuffled list of all song IDs."""
+        deck = list(songs_data["_by_id"])
+        random.shuffle(deck)
+        return deck
+
     @socketio.on("connect")
     def handle_connect():
         print(f"Client connected: {request.sid}")
@@ -103,12 +168,9 @@ def register_buzzer_events(socketio, songs_data):
                 elif sid in room["players"]:
                     # Mark player as disconnected (allow rejoin)
                     room["players"][sid]["connected"] = False
-                    emit("room_state", get_room_state(room_code), room=room_code)
-                    emit(
-                        "room_state",
-                        get_room_state(room_code, for_host=True),
-                        room=f"{room_code}_host",
-                    )
+                    room["connected_sids"].discard(sid)
+                    invalidate_room_state(room)
+                    emit_room_state(room_code)
 
             del player_sessions[sid]
 
@@ -124,12 +186,13 @@ def register_buzzer_events(socketio, songs_data):
             "host_connected": True,
             "max_score": max_score,
             "players": {},
+            "connected_sids": set(),
             "current_song": None,
             "round_active": False,
-            "buzz_queue": [],
+            "buzz_queue": deque(),
             "current_buzzer": None,
             "locked_out": set(),
-            "used_song_ids": set(),
+            "deck": [],
             "game_started": False,
             "game_ended": False,
             "winner": None,
@@ -177,9 +240,9 @@ def register_buzzer_events(socketio, songs_data):
             room["players"][sid] = player_data
 
             # Update buzz queue if player was in it
-            room["buzz_queue"] = [
+            room["buzz_queue"] = deque(
                 sid if x == existing_sid else x for x in room["buzz_queue"]
-            ]
+            )
             if room["current_buzzer"] == existing_sid:
                 room["current_buzzer"] = sid
             if existing_sid in room["locked_out"]:
@@ -193,6 +256,9 @@ def register_buzzer_events(socketio, songs_data):
 
             room["players"][sid] = {"name": player_name, "score": 0, "connected": True}
 
+        room["connected_sids"].add(sid)
+        invalidate_leaderboard(room)
+        invalidate_room_state(room)
         player_sessions[sid] = room_code
         join_room(room_code)
 
@@ -207,12 +273,7 @@ def register_buzzer_events(socketio, songs_data):
 
         # Notify everyone
         emit("player_joined", {"name": player_name}, room=room_code)
-        emit("room_state", get_room_state(room_code), room=room_code)
-        emit(
-            "room_state",
-            get_room_state(room_code, for_host=True),
-            room=f"{room_code}_host",
-        )
+        emit_room_state(room_code)
 
         print(f"Player {player_name} joined room {room_code}")
 
@@ -229,17 +290,25 @@ def register_buzzer_events(socketio, songs_data):
         if room and sid in room["players"]:
             player_name = room["players"][sid]["name"]
             del room["players"][sid]
+            room["connected_sids"].discard(sid)
+
+            # Drop the player from the round; the next buzzer takes over
+            if sid in room["buzz_queue"]:
+                room["buzz_queue"].remove(sid)
+            room["locked_out"].discard(sid)
+            if room["current_buzzer"] == sid:
+                room["current_buzzer"] = (
+                    room["buzz_queue"][0] if room["buzz_queue"] else None
+                )
+
+            invalidate_leaderboard(room)
+            invalidate_room_state(room)
 
             leave_room(room_code)
             del player_sessions[sid]
 
             emit("player_left", {"name": player_name}, room=room_code)
-            emit("room_state", get_room_state(room_code), room=room_code)
-            emit(
-                "room_state",
-                get_room_state(room_code, for_host=True),
-                room=f"{room_code}_host",
-            )
+            emit_room_state(room_code)
 
     @socketio.on("start_game")
     def handle_start_game():
@@ -260,14 +329,11 @@ def register_buzzer_events(socketio, songs_data):
             return
 
         room["game_started"] = True
+        room["deck"] = new_deck()
+        invalidate_room_state(room)
 
         emit("game_started", {}, room=room_code)
-        emit("room_state", get_room_state(room_code), room=room_code)
-        emit(
-            "room_state",
-            get_room_state(room_code, for_host=True),
-            room=f"{room_code}_host",
-        )
+        emit_room_state(room_code)
 
         print(f"Game started in room {room_code}")
 
@@ -287,26 +353,22 @@ def register_buzzer_events(socketio, songs_data):
         if room["game_ended"]:
             return
 
-        # Get a random song
-        all_songs = songs_data.get("songs", [])
-        available = [s for s in all_songs if s["id"] not in room["used_song_ids"]]
-
-        if not available:
-            # Reset pool if exhausted
-            room["used_song_ids"].clear()
-            available = all_songs
+        # Draw the next song from the shuffled deck
+        if not room["deck"]:
+            # Reshuffle if exhausted
+            room["deck"] = new_deck()
 
-        if not available:
+        if not room["deck"]:
             emit("error", {"message": "Keine Songs verfügbar"})
             return
 
-        song = random.choice(available)
-        room["used_song_ids"].add(song["id"])
+        song = songs_data["_by_id"][room["deck"].pop()]
         room["current_song"] = song
         room["round_active"] = True
-        room["buzz_queue"] = []
+        room["buzz_queue"] = deque()
         room["current_buzzer"] = None
         room["locked_out"] = set()
+        invalidate_room_state(room)
 
         # Send to host (full song info)
         emit("round_started", {"song": song}, room=f"{room_code}_host")
@@ -318,12 +380,7 @@ def register_buzzer_events(socketio, songs_data):
             room=room_code,
         )
 
-        emit("room_state", get_room_state(room_code), room=room_code)
-        emit(
-            "room_state",
-            get_room_state(room_code, for_host=True),
-            room=f"{room_code}_host",
-        )
+        emit_room_state(room_code)
 
         print(f"Round started in room {room_code}: {song['title']}")
 
@@ -355,25 +412,27 @@ def register_buzzer_events(socketio, songs_data):
         if room["current_buzzer"] is None:
             room["current_buzzer"] = sid
 
+        invalidate_room_state(room)
+
         player_name = room["players"][sid]["name"]
+        current_buzzer = room["players"][room["current_buzzer"]]
 
+        # Clients apply this delta to their local state; the full room_state
+        # is only broadcast on join/leave/judge/round changes.
         emit(
             "player_buzzed",
             {
                 "playerId": sid,
                 "playerName": player_name,
                 "position": len(room["buzz_queue"]),
+                "currentBuzzer": {
+                    "id": room["current_buzzer"],
+                    "name": current_buzzer["name"],
+                },
             },
             room=room_code,
         )
 
-        emit("room_state", get_room_state(room_code), room=room_code)
-        emit(
-            "room_state",
-            get_room_state(room_code, for_host=True),
-            room=f"{room_code}_host",
-        )
-
         print(f"Player {player_name} buzzed in room {room_code}")
 
     @socketio.on("judge")
@@ -413,6 +472,7 @@ def register_buzzer_events(socketio, songs_data):
         if points > 0:
             # Correct answer - award points and end round
             buzzer["score"] += points
+            invalidate_leaderboard(room)
             room["round_active"] = False
             room["current_buzzer"] = None
 
@@ -426,19 +486,19 @@ def register_buzzer_events(socketio, songs_data):
                 result["gameEnded"] = True
                 result["winner"] = buzzer["name"]
 
+            invalidate_room_state(room)
             emit("judge_result", result, room=room_code)
-            emit("room_state", get_room_state(room_code), room=room_code)
-            emit(
-                "room_state",
-                get_room_state(room_code, for_host=True),
-                room=f"{room_code}_host",
-            )
+            emit_room_state(room_code)
 
             print(f"Player {buzzer['name']} scored {points} points in room {room_code}")
         else:
             # Wrong answer - lock out and move to next in queue
             room["locked_out"].add(buzzer_sid)
-            room["buzz_queue"].remove(buzzer_sid)
+            # The judged player is the head of the queue
+            if room["buzz_queue"] and room["buzz_queue"][0] == buzzer_sid:
+                room["buzz_queue"].popleft()
+            else:
+                room["buzz_queue"].remove(buzzer_sid)
 
             if room["buzz_queue"]:
                 room["current_buzzer"] = room["buzz_queue"][0]
@@ -448,22 +508,15 @@ def register_buzzer_events(socketio, songs_data):
             result["lockedOut"] = True
 
             # Check if all players are locked out
-            connected_players = [
-                sid for sid, p in room["players"].items() if p.get("connected", True)
-            ]
-            if room["locked_out"] >= set(connected_players):
+            if room["locked_out"] >= room["connected_sids"]:
                 room["round_active"] = False
                 result["roundEnded"] = True
                 result["allLockedOut"] = True
                 result["song"] = room["current_song"]
 
+            invalidate_room_state(room)
             emit("judge_result", result, room=room_code)
-            emit("room_state", get_room_state(room_code), room=room_code)
-            emit(
-                "room_state",
-                get_room_state(room_code, for_host=True),
-                room=f"{room_code}_host",
-            )
+            emit_room_state(room_code)
 
             print(f"Player {buzzer['name']} locked out in room {room_code}")
 
@@ -482,16 +535,12 @@ def register_buzzer_events(socketio, songs_data):
 
         room["round_active"] = False
         room["current_buzzer"] = None
-        room["buzz_queue"] = []
+        room["buzz_queue"] = deque()
+        invalidate_room_state(room)
 
         emit("round_skipped", {"song": room["current_song"]}, room=room_code)
 
-        emit("room_state", get_room_state(room_code), room=room_code)
-        emit(
-            "room_state",
-            get_room_state(room_code, for_host=True),
-            room=f"{room_code}_host",
-        )
+        emit_room_state(room_code)
 
         print(f"Round skipped in room {room_code}")
 
@@ -516,6 +565,8 @@ def register_buzzer_events(socketio, songs_data):
             winner = max(room["players"].values(), key=lambda p: p["score"])
             room["winner"] = winner["name"]
 
+        invalidate_room_state(room)
+
         emit(
             "game_ended",
             {
@@ -0,0 +1,45 @@
+"""
+BeatGuessr JSON helpers - orjson when available, stdlib json otherwise
+"""
+
+import json
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(obj):
+    """Serialize to UTF-8 encoded JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj, **kwargs):
+    """Serialize to a JSON string. Extra stdlib kwargs are ignored."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, **kwargs)
+
+
+def loads(s, **kwargs):
+    """Parse JSON from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(s)
+    return json.loads(s, **kwargs)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
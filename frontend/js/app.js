@@ -53,7 +53,7 @@ class BeatGuessrApp {
         // Connect to the server (same host for production, or specify dev server)
         const socketUrl = window.location.origin;
         this.socket = io(socketUrl, {
-            transports: ['websocket', 'polling'],
+            transports: ['websocket'],
             reconnection: true,
             reconnectionAttempts: 5,
             reconnectionDelay: 1000
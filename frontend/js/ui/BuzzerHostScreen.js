@@ -11,6 +11,7 @@ class BuzzerHostScreen {
         this.roomCode = null;
         this.maxScore = 10;
         this.players = [];
+        this.buzzQueue = [];
         this.currentSong = null;
         this.roundActive = false;
         this.gameStarted = false;
@@ -123,6 +124,7 @@ class BuzzerHostScreen {
         
         this.socket.on('player_buzzed', (data) => {
             this.playSound('buzz');
+            this.onPlayerBuzzed(data);
         });
         
         this.socket.on('judge_result', (data) => {
@@ -183,14 +185,22 @@ class BuzzerHostScreen {
         this.updateScoreboard();
         
         // Update buzzer display
+        this.buzzQueue = state.buzzQueue || [];
         if (state.currentBuzzer) {
             this.showCurrentBuzzer(state.currentBuzzer.name);
-            this.updateBuzzQueue(state.buzzQueue.slice(1)); // Exclude current buzzer
+            this.updateBuzzQueue(this.buzzQueue.slice(1)); // Exclude current buzzer
         } else if (this.roundActive) {
             this.showWaitingForBuzz();
         }
     }
     
+    onPlayerBuzzed(data) {
+        // Apply the buzz delta locally (no full room_state is sent on buzz)
+        this.buzzQueue.push({ id: data.playerId, name: data.playerName });
+        this.showCurrentBuzzer(data.currentBuzzer.name);
+        this.updateBuzzQueue(this.buzzQueue.filter(p => p.id !== data.currentBuzzer.id));
+    }
+    
     updateScoreboard() {
         const sorted = [...this.players].sort((a, b) => b.score - a.score);
         this.scoreboard.innerHTML = sorted.map((p, i) => `
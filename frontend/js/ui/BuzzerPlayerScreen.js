@@ -89,6 +89,9 @@ class BuzzerPlayerScreen {
             if (data.playerId !== this.socket.id) {
                 // Someone else buzzed
                 this.playSound('buzz');
+                if (this.roundActive && !this.isLockedOut && !this.hasBuzzed) {
+                    this.setBuzzerTaken(data.currentBuzzer.name);
+                }
             }
         });
         